@@ -1,29 +1,56 @@
 from __future__ import annotations
 
+from functools import lru_cache
 
 RGB = tuple[int, int, int]
 CMYK = tuple[float, float, float, float]
 HSV = tuple[float, float, float]
 
+# The public RGB-side converters clamp once in _validate_rgb; the cached
+# cores behind them assume channels already in 0..255.
+INV_255 = 1.0 / 255.0
+
+# Per hue sector, indices into (v, q, p, t) for the R, G and B channels.
+HSV_SECTORS = (
+    (0, 3, 2),
+    (1, 0, 2),
+    (2, 0, 3),
+    (2, 1, 0),
+    (3, 2, 0),
+    (0, 2, 1),
+)
+
 
 def clamp(value: float, lower: float, upper: float) -> float:
     return max(lower, min(upper, value))
 
 
+def _validate_rgb(r: int, g: int, b: int) -> RGB:
+    if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        return r, g, b
+    return clamp(r, 0, 255), clamp(g, 0, 255), clamp(b, 0, 255)
+
+
 def rgb_to_cmyk(r: int, g: int, b: int) -> CMYK:
-    r_norm = clamp(r, 0, 255) / 255.0
-    g_norm = clamp(g, 0, 255) / 255.0
-    b_norm = clamp(b, 0, 255) / 255.0
+    return _rgb_to_cmyk(*_validate_rgb(r, g, b))
 
-    k = 1.0 - max(r_norm, g_norm, b_norm)
-    if k >= 0.999999:
+
+@lru_cache(maxsize=4096)
+def _rgb_to_cmyk(r: int, g: int, b: int) -> CMYK:
+    max_channel = r if r > g else g
+    max_channel = max_channel if max_channel > b else b
+
+    if max_channel == 0:
         return 0.0, 0.0, 0.0, 100.0
 
-    c = (1.0 - r_norm - k) / (1.0 - k)
-    m = (1.0 - g_norm - k) / (1.0 - k)
-    y = (1.0 - b_norm - k) / (1.0 - k)
+    # (1 - channel/255 - k) / (1 - k) with k = 1 - max/255, kept in integers
+    # so that unrounded results carry no float drift.
+    c = (max_channel - r) / max_channel
+    m = (max_channel - g) / max_channel
+    y = (max_channel - b) / max_channel
+    k = 1.0 - max_channel * INV_255
 
-    return tuple(round(component * 100.0, 2) for component in (c, m, y, k))
+    return c * 100.0, m * 100.0, y * 100.0, k * 100.0
 
 
 def cmyk_to_rgb(c: float, m: float, y: float, k: float) -> RGB:
@@ -32,36 +59,40 @@ def cmyk_to_rgb(c: float, m: float, y: float, k: float) -> RGB:
     y_norm = clamp(y, 0.0, 100.0) / 100.0
     k_norm = clamp(k, 0.0, 100.0) / 100.0
 
-    r = 255.0 * (1.0 - c_norm) * (1.0 - k_norm)
-    g = 255.0 * (1.0 - m_norm) * (1.0 - k_norm)
-    b = 255.0 * (1.0 - y_norm) * (1.0 - k_norm)
+    k_scale = 255.0 * (1.0 - k_norm)
+    r = (1.0 - c_norm) * k_scale
+    g = (1.0 - m_norm) * k_scale
+    b = (1.0 - y_norm) * k_scale
 
-    return tuple(int(round(channel)) for channel in (r, g, b))
+    return int(r + 0.5), int(g + 0.5), int(b + 0.5)
 
 
 def rgb_to_hsv(r: int, g: int, b: int) -> HSV:
-    r_norm = clamp(r, 0, 255) / 255.0
-    g_norm = clamp(g, 0, 255) / 255.0
-    b_norm = clamp(b, 0, 255) / 255.0
+    return _rgb_to_hsv(*_validate_rgb(r, g, b))
 
-    max_val = max(r_norm, g_norm, b_norm)
-    min_val = min(r_norm, g_norm, b_norm)
-    delta = max_val - min_val
+
+@lru_cache(maxsize=4096)
+def _rgb_to_hsv(r: int, g: int, b: int) -> HSV:
+    max_channel = r if r > g else g
+    max_channel = max_channel if max_channel > b else b
+    min_channel = r if r < g else g
+    min_channel = min_channel if min_channel < b else b
+    delta = max_channel - min_channel
 
     # Hue calculation
     if delta == 0:
         hue = 0.0
-    elif max_val == r_norm:
-        hue = (60 * ((g_norm - b_norm) / delta) + 360) % 360
-    elif max_val == g_norm:
-        hue = (60 * ((b_norm - r_norm) / delta) + 120) % 360
-    else:  # max_val == b_norm
-        hue = (60 * ((r_norm - g_norm) / delta) + 240) % 360
+    elif max_channel == r:
+        hue = (60 * ((g - b) / delta) + 360) % 360
+    elif max_channel == g:
+        hue = (60 * ((b - r) / delta) + 120) % 360
+    else:  # max_channel == b
+        hue = (60 * ((r - g) / delta) + 240) % 360
 
-    saturation = 0.0 if max_val == 0 else delta / max_val
-    value = max_val
+    saturation = 0.0 if max_channel == 0 else delta / max_channel
+    value = max_channel * INV_255
 
-    return round(hue, 2), round(saturation * 100.0, 2), round(value * 100.0, 2)
+    return hue, saturation * 100.0, value * 100.0
 
 
 def hsv_to_rgb(h: float, s: float, v: float) -> RGB:
@@ -81,25 +112,21 @@ def hsv_to_rgb(h: float, s: float, v: float) -> RGB:
     q = v_norm * (1.0 - s_norm * fraction)
     t = v_norm * (1.0 - s_norm * (1.0 - fraction))
 
-    sector_map = {
-        0: (v_norm, t, p),
-        1: (q, v_norm, p),
-        2: (p, v_norm, t),
-        3: (p, q, v_norm),
-        4: (t, p, v_norm),
-    }
-
-    r_norm, g_norm, b_norm = sector_map.get(sector_index % 6, (v_norm, p, q))
+    components = (v_norm, q, p, t)
+    r_index, g_index, b_index = HSV_SECTORS[sector_index % 6]
+    r_norm = components[r_index]
+    g_norm = components[g_index]
+    b_norm = components[b_index]
 
     return tuple(int(round(channel * 255.0)) for channel in (r_norm, g_norm, b_norm))
 
 
 def cmyk_to_hsv(c: float, m: float, y: float, k: float) -> HSV:
-    return rgb_to_hsv(*cmyk_to_rgb(c, m, y, k))
+    return _rgb_to_hsv(*cmyk_to_rgb(c, m, y, k))
 
 
 def hsv_to_cmyk(h: float, s: float, v: float) -> CMYK:
-    return rgb_to_cmyk(*hsv_to_rgb(h, s, v))
+    return _rgb_to_cmyk(*hsv_to_rgb(h, s, v))
 
 
 def normalize_rgb(r: int, g: int, b: int) -> RGB:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import string
 from typing import Dict, Iterable
 
 import tkinter as tk
@@ -15,10 +16,12 @@ from color_models import (
     rgb_to_hsv,
 )
 
+HEX_DIGITS = tuple(f"{value:02X}" for value in range(256))
+
 
 def rgb_to_hex(rgb: Iterable[int]) -> str:
     r, g, b = normalize_rgb(*rgb)
-    return f"#{r:02X}{g:02X}{b:02X}"
+    return "#" + HEX_DIGITS[r] + HEX_DIGITS[g] + HEX_DIGITS[b]
 
 
 def clamp_value(value: float, lower: float, upper: float) -> float:
@@ -27,9 +30,11 @@ def clamp_value(value: float, lower: float, upper: float) -> float:
 
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     text = (hex_color or "").strip().lstrip("#")
-    if len(text) != 6:
+    # int() alone would also accept "0x", signs and underscores.
+    if len(text) != 6 or not all(char in string.hexdigits for char in text):
         raise ValueError("Expected hex color in format RRGGBB")
-    return tuple(int(text[i : i + 2], 16) for i in (0, 2, 4))
+    value = int(text, 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
 
 
 class ColorModelsApp:
@@ -43,6 +48,8 @@ class ColorModelsApp:
         self.current_hsv = rgb_to_hsv(*self.current_rgb)
         self.current_cmyk = rgb_to_cmyk(*self.current_rgb)
         self.updating = False
+        self._refresh_after_id: str | None = None
+        self._refresh_source: str | None = None
 
         self.component_configs: Dict[str, Dict[str, Dict[str, float]]] = {
             "RGB": {
@@ -239,7 +246,7 @@ class ColorModelsApp:
             self.entries[prefix][component].set(str(value))
             rgb_list = list(self.current_rgb)
             rgb_list["RGB".index(component)] = value
-            self.update_from_rgb(tuple(rgb_list))
+            self.update_from_rgb(tuple(rgb_list), source=prefix)
         elif prefix == "HSV":
             value = raw_value
             self.entries[prefix][component].set(f"{value:.2f}")
@@ -247,7 +254,9 @@ class ColorModelsApp:
             index = "HSV".index(component)
             hsv_list[index] = value
             new_hsv = normalize_hsv(*hsv_list)
-            self.update_from_rgb(hsv_to_rgb(*new_hsv))
+            self.update_from_rgb(
+                hsv_to_rgb(*new_hsv), source=prefix, source_values=new_hsv
+            )
         elif prefix == "CMYK":
             value = raw_value
             self.entries[prefix][component].set(f"{value:.2f}")
@@ -255,7 +264,9 @@ class ColorModelsApp:
             index = "CMYK".index(component)
             cmyk_list[index] = value
             new_cmyk = normalize_cmyk(*cmyk_list)
-            self.update_from_rgb(cmyk_to_rgb(*new_cmyk))
+            self.update_from_rgb(
+                cmyk_to_rgb(*new_cmyk), source=prefix, source_values=new_cmyk
+            )
 
     def on_entry_commit(self, prefix: str, component: str) -> None:
         if self.updating:
@@ -281,7 +292,7 @@ class ColorModelsApp:
             self.scales[prefix][component].set(value)
             rgb_list = list(self.current_rgb)
             rgb_list["RGB".index(component)] = value
-            self.update_from_rgb(tuple(rgb_list))
+            self.update_from_rgb(tuple(rgb_list), source=prefix)
         elif prefix == "HSV":
             value = clamp_value(value, config["min"], config["max"])
             hsv_list = list(self.current_hsv)
@@ -290,7 +301,9 @@ class ColorModelsApp:
             new_hsv = normalize_hsv(*hsv_list)
             self.scales[prefix][component].set(new_hsv[index])
             self.entries[prefix][component].set(f"{new_hsv[index]:.2f}")
-            self.update_from_rgb(hsv_to_rgb(*new_hsv))
+            self.update_from_rgb(
+                hsv_to_rgb(*new_hsv), source=prefix, source_values=new_hsv
+            )
         elif prefix == "CMYK":
             value = clamp_value(value, config["min"], config["max"])
             cmyk_list = list(self.current_cmyk)
@@ -299,7 +312,9 @@ class ColorModelsApp:
             new_cmyk = normalize_cmyk(*cmyk_list)
             self.scales[prefix][component].set(new_cmyk[index])
             self.entries[prefix][component].set(f"{new_cmyk[index]:.2f}")
-            self.update_from_rgb(cmyk_to_rgb(*new_cmyk))
+            self.update_from_rgb(
+                cmyk_to_rgb(*new_cmyk), source=prefix, source_values=new_cmyk
+            )
 
     def pick_color(self) -> None:
         result = colorchooser.askcolor(initialcolor=rgb_to_hex(self.current_rgb))
@@ -313,31 +328,54 @@ class ColorModelsApp:
     def reset(self) -> None:
         self.update_from_rgb(self.initial_rgb)
 
-    def update_from_rgb(self, rgb: Iterable[int]) -> None:
-        self.updating = True
-
+    def update_from_rgb(
+        self,
+        rgb: Iterable[int],
+        source: str | None = None,
+        source_values: tuple[float, ...] | None = None,
+    ) -> None:
         self.current_rgb = normalize_rgb(*rgb)
-        self.current_hsv = rgb_to_hsv(*self.current_rgb)
-        self.current_cmyk = rgb_to_cmyk(*self.current_rgb)
-
-        for index, component in enumerate("RGB"):
-            value = self.current_rgb[index]
-            self.scales["RGB"][component].set(value)
-            self.entries["RGB"][component].set(str(value))
-
-        for index, component in enumerate("HSV"):
-            value = self.current_hsv[index]
-            self.scales["HSV"][component].set(value)
-            self.entries["HSV"][component].set(f"{value:.2f}")
+        # The edited model keeps its own values: its widgets are not rewritten,
+        # and a trip through RGB would lose hue at V=0 or C/M/Y at K=100.
+        if source == "HSV" and source_values is not None:
+            self.current_hsv = source_values
+        else:
+            self.current_hsv = rgb_to_hsv(*self.current_rgb)
+        if source == "CMYK" and source_values is not None:
+            self.current_cmyk = source_values
+        else:
+            self.current_cmyk = rgb_to_cmyk(*self.current_rgb)
+
+        if self._refresh_after_id is None:
+            self._refresh_source = source
+            self._refresh_after_id = self.root.after_idle(self._push_current_values)
+        elif self._refresh_source != source:
+            self._refresh_source = None
+
+    def _push_current_values(self) -> None:
+        self._refresh_after_id = None
+        self.updating = True
 
-        for index, component in enumerate("CMYK"):
-            value = self.current_cmyk[index]
-            self.scales["CMYK"][component].set(value)
-            self.entries["CMYK"][component].set(f"{value:.2f}")
+        commands: list[str] = []
+        for prefix, values in (
+            ("RGB", self.current_rgb),
+            ("HSV", self.current_hsv),
+            ("CMYK", self.current_cmyk),
+        ):
+            if prefix == self._refresh_source:
+                continue
+            for component, value in zip(prefix, values):
+                text = self._format_value(prefix, value)
+                commands.append(f"{self.scales[prefix][component]} set {value}")
+                commands.append(f"set ::{self.entries[prefix][component]} {text}")
 
         color_hex = rgb_to_hex(self.current_rgb)
-        self.preview_label.configure(background=color_hex)
-        self.hex_var.set(color_hex)
+        commands.append(f"{self.preview_label} configure -background {color_hex}")
+        commands.append(f"set ::{self.hex_var} {color_hex}")
+        self.root.tk.eval("\n".join(commands))
+        # Scales run -command for a programmatic set from their idle redraw;
+        # flush it here so those callbacks still see self.updating.
+        self.root.update_idletasks()
 
         self.updating = False
 
@@ -1,127 +1,100 @@
 from __future__ import annotations
 
-import math
-from typing import List, Sequence, Tuple
+from typing import Sequence, Tuple
 
 import tkinter as tk
 
-RGBPixel = Tuple[int, int, int]
-RGBImage = List[List[RGBPixel]]
-GrayImage = List[List[int]]
+import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
 
-def _parse_pixel(pixel: object) -> RGBPixel:
-    if isinstance(pixel, tuple) and len(pixel) == 3:
-        r, g, b = pixel
-        return int(r), int(g), int(b)
+RGBImage = np.ndarray
+GrayImage = np.ndarray
 
-    text = str(pixel).strip()
-    if text.startswith("#") and len(text) == 7:
-        return tuple(int(text[i : i + 2], 16) for i in (1, 3, 5))  # type: ignore[arg-type]
-
-    if text.startswith("rgb"):
-        components = text[text.find("(") + 1 : text.find(")")]  # rgb(r,g,b)
-        parts = [part.strip() for part in components.split(",")]
-        return tuple(int(part) for part in parts[:3])  # type: ignore[arg-type]
-
-    raise ValueError(f"Unsupported pixel format: {pixel!r}")
-
-
-def clamp(value: float, lower: int = 0, upper: int = 255) -> int:
-    return int(max(lower, min(upper, round(value))))
+# Fixed-point luminance weights, one 256-entry table per channel (3 KB total).
+# A single packed 24-bit RGB table would be 16 MB and would not stay in cache.
+GRAY_LUT_R = np.arange(256, dtype=np.uint16) * 77
+GRAY_LUT_G = np.arange(256, dtype=np.uint16) * 150
+GRAY_LUT_B = np.arange(256, dtype=np.uint16) * 29 + 128
 
 
 def photoimage_to_rgb(image: tk.PhotoImage) -> RGBImage:
     width = image.width()
     height = image.height()
-    data: RGBImage = []
-    for y in range(height):
-        row: List[RGBPixel] = []
-        for x in range(width):
-            row.append(_parse_pixel(image.get(x, y)))
-        data.append(row)
-    return data
+    raw = image.data(format="ppm")
+    pixels = np.frombuffer(raw, dtype=np.uint8, offset=len(raw) - width * height * 3)
+    return pixels.reshape(height, width, 3)
 
 
 def rgb_to_photoimage(data: RGBImage) -> tk.PhotoImage:
-    height = len(data)
-    width = len(data[0]) if height else 0
-    photo = tk.PhotoImage(width=width, height=height)
-    for y, row in enumerate(data):
-        buffer = "{" + " ".join(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in row) + "}"
-        photo.put(buffer, to=(0, y))
-    return photo
+    pixels = np.asarray(data, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    header = b"P6\n%d %d\n255\n" % (width, height)
+    return tk.PhotoImage(data=header + pixels.tobytes(), format="ppm")
+
+
+def grayscale_to_photoimage(data: GrayImage) -> tk.PhotoImage:
+    # Tk's ppm handler also reads single-channel P5, one byte per pixel.
+    pixels = np.asarray(data, dtype=np.uint8)
+    height, width = pixels.shape
+    header = b"P5\n%d %d\n255\n" % (width, height)
+    return tk.PhotoImage(data=header + pixels.tobytes(), format="ppm")
 
 
 def rgb_to_grayscale(data: RGBImage) -> GrayImage:
-    grayscale: GrayImage = []
-    for row in data:
-        gray_row = [clamp(0.299 * r + 0.587 * g + 0.114 * b) for r, g, b in row]
-        grayscale.append(gray_row)
-    return grayscale
+    gray = (
+        GRAY_LUT_R[data[..., 0]] + GRAY_LUT_G[data[..., 1]] + GRAY_LUT_B[data[..., 2]]
+    )
+    return (gray >> 8).astype(np.uint8)
 
 
 def grayscale_to_rgb(data: GrayImage) -> RGBImage:
-    return [[(value, value, value) for value in row] for row in data]
+    return np.broadcast_to(data[..., np.newaxis], data.shape + (3,))
 
 
-def compute_histogram(data: GrayImage) -> List[int]:
-    histogram = [0] * 256
-    for row in data:
-        for value in row:
-            histogram[value] += 1
-    return histogram
+def compute_histogram(data: GrayImage) -> np.ndarray:
+    return np.bincount(data.ravel(), minlength=256).astype(np.int64)
 
 
 def otsu_threshold(histogram: Sequence[int]) -> int:
-    total = sum(histogram)
+    counts = np.asarray(histogram, dtype=np.int64)
+    total = counts.sum()
     if total == 0:
         return 0
 
-    sum_total = sum(index * count for index, count in enumerate(histogram))
-    sum_background = 0.0
-    weight_background = 0.0
-    max_variance = -1.0
-    threshold = 0
-
-    for index, count in enumerate(histogram):
-        weight_background += count
-        if weight_background == 0:
-            continue
-
-        weight_foreground = total - weight_background
-        if weight_foreground == 0:
-            break
-
-        sum_background += index * count
+    weight_background = np.cumsum(counts)
+    weight_foreground = total - weight_background
+    sum_background = np.cumsum(np.arange(counts.size) * counts)
+    sum_total = sum_background[-1]
 
+    with np.errstate(divide="ignore", invalid="ignore"):
         mean_background = sum_background / weight_background
         mean_foreground = (sum_total - sum_background) / weight_foreground
-
         between_variance = (
             weight_background
             * weight_foreground
             * (mean_background - mean_foreground) ** 2
         )
 
-        if between_variance > max_variance:
-            max_variance = between_variance
-            threshold = index
-
-    return threshold
+    between_variance[~np.isfinite(between_variance)] = -1.0
+    return int(between_variance.argmax())
 
 
 def triangle_threshold(histogram: Sequence[int]) -> int:
-    non_zero_indices = [index for index, count in enumerate(histogram) if count > 0]
-    if not non_zero_indices:
+    counts = np.asarray(histogram, dtype=np.int64)
+    non_zero_indices = np.flatnonzero(counts)
+    if non_zero_indices.size == 0:
         return 0
 
-    first = non_zero_indices[0]
-    last = non_zero_indices[-1]
+    first = int(non_zero_indices[0])
+    last = int(non_zero_indices[-1])
     if first == last:
         return first
 
-    peak = max(range(first, last + 1), key=lambda idx: histogram[idx])
+    peak = first + int(counts[first : last + 1].argmax())
 
     if (last - peak) >= (peak - first):
         start = peak
@@ -133,33 +106,17 @@ def triangle_threshold(histogram: Sequence[int]) -> int:
         step = -1
 
     vec_x = end - start
-    vec_y = histogram[end] - histogram[start]
-    length = math.hypot(vec_x, vec_y)
-    if length == 0:
-        return start
-
-    max_distance = -1.0
-    threshold = start
-
-    current = start
-    while True:
-        rel_x = current - start
-        rel_y = histogram[current] - histogram[start]
-        distance = abs(vec_x * rel_y - vec_y * rel_x) / length
-        if distance > max_distance:
-            max_distance = distance
-            threshold = current
-
-        if current == end:
-            break
-
-        current += step
+    vec_y = counts[end] - counts[start]
 
-    return threshold
+    candidates = np.arange(start, end + step, step)
+    rel_x = candidates - start
+    rel_y = counts[candidates] - counts[start]
+    distances = np.abs(vec_x * rel_y - vec_y * rel_x)
+    return int(candidates[distances.argmax()])
 
 
 def apply_threshold(data: GrayImage, threshold: int) -> GrayImage:
-    return [[0 if value <= threshold else 255 for value in row] for row in data]
+    return (data > threshold).view(np.uint8) * np.uint8(255)
 
 
 LAPLACIAN_KERNEL: Tuple[Tuple[int, int, int], ...] = (
@@ -169,41 +126,60 @@ LAPLACIAN_KERNEL: Tuple[Tuple[int, int, int], ...] = (
 )
 
 
+if njit is not None:
+
+    # No cache=True: the on-disk cache records the importing module's name and
+    # breaks when this file is loaded both as image_ops and lab2.image_ops.
+    # The stencil below is LAPLACIAN_KERNEL unrolled, with clamped neighbour
+    # indices standing in for the NumPy path's edge padding; keep them in sync.
+    @njit(parallel=True)
+    def _laplacian_numba(data, amount, out):  # pragma: no cover - compiled
+        height, width, channels = data.shape
+        for y in prange(height):
+            up = max(y - 1, 0)
+            down = min(y + 1, height - 1)
+            for x in range(width):
+                left = max(x - 1, 0)
+                right = min(x + 1, width - 1)
+                for k in range(channels):
+                    center = np.int32(data[y, x, k])
+                    laplacian = (
+                        4 * center
+                        - np.int32(data[up, x, k])
+                        - np.int32(data[down, x, k])
+                        - np.int32(data[y, left, k])
+                        - np.int32(data[y, right, k])
+                    )
+                    value = round(center + amount * laplacian)
+                    out[y, x, k] = 0 if value < 0 else (255 if value > 255 else value)
+
+else:
+    _laplacian_numba = None
+
+
 def laplacian_sharpen(data: RGBImage, amount: float = 1.0) -> RGBImage:
-    height = len(data)
-    width = len(data[0]) if height else 0
-    result: RGBImage = []
-
-    for y in range(height):
-        row: List[RGBPixel] = []
-        for x in range(width):
-            laplacian = [0.0, 0.0, 0.0]
-            for ky, kernel_row in enumerate(LAPLACIAN_KERNEL):
-                for kx, weight in enumerate(kernel_row):
-                    if weight == 0:
-                        continue
-                    yy = min(max(y + ky - 1, 0), height - 1)
-                    xx = min(max(x + kx - 1, 0), width - 1)
-                    pr, pg, pb = data[yy][xx]
-                    laplacian[0] += weight * pr
-                    laplacian[1] += weight * pg
-                    laplacian[2] += weight * pb
-
-            original = data[y][x]
-            sharpened = tuple(
-                clamp(original[channel] + amount * laplacian[channel])
-                for channel in range(3)
-            )
-            row.append(sharpened)
-        result.append(row)
-
-    return result
+    if _laplacian_numba is not None:
+        result = np.empty(data.shape, dtype=np.uint8)
+        _laplacian_numba(data, float(amount), result)
+        return result
 
+    height, width = data.shape[:2]
+    original = data.astype(np.int16)
+    padded = np.pad(original, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    laplacian = np.zeros_like(original)
 
-def threshold_photoimage(
-    image: tk.PhotoImage, method: str
-) -> Tuple[int, tk.PhotoImage]:
-    rgb_data = photoimage_to_rgb(image)
+    for ky, kernel_row in enumerate(LAPLACIAN_KERNEL):
+        for kx, weight in enumerate(kernel_row):
+            if weight == 0:
+                continue
+            laplacian += weight * padded[ky : ky + height, kx : kx + width]
+
+    # float() keeps an integer amount from wrapping around in int16.
+    sharpened = np.rint(original + float(amount) * laplacian)
+    return np.clip(sharpened, 0, 255).astype(np.uint8)
+
+
+def threshold_array(rgb_data: RGBImage, method: str) -> Tuple[int, tk.PhotoImage]:
     grayscale = rgb_to_grayscale(rgb_data)
     histogram = compute_histogram(grayscale)
 
@@ -214,12 +190,19 @@ def threshold_photoimage(
     else:
         raise ValueError("Unsupported thresholding method")
 
-    binary = apply_threshold(grayscale, threshold)
-    photo = rgb_to_photoimage(grayscale_to_rgb(binary))
+    photo = grayscale_to_photoimage(apply_threshold(grayscale, threshold))
     return threshold, photo
 
 
+def sharpen_array(rgb_data: RGBImage, amount: float = 1.0) -> tk.PhotoImage:
+    return rgb_to_photoimage(laplacian_sharpen(rgb_data, amount=amount))
+
+
+def threshold_photoimage(
+    image: tk.PhotoImage, method: str
+) -> Tuple[int, tk.PhotoImage]:
+    return threshold_array(photoimage_to_rgb(image), method)
+
+
 def sharpen_photoimage(image: tk.PhotoImage, amount: float = 1.0) -> tk.PhotoImage:
-    rgb_data = photoimage_to_rgb(image)
-    sharpened = laplacian_sharpen(rgb_data, amount=amount)
-    return rgb_to_photoimage(sharpened)
+    return sharpen_array(photoimage_to_rgb(image), amount=amount)
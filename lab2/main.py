@@ -13,6 +13,8 @@ class ImageProcessingApp:
 
         self.original_image: tk.PhotoImage | None = None
         self.processed_image: tk.PhotoImage | None = None
+        self._threshold_cache: dict[tuple[int, str], tuple[int, tk.PhotoImage]] = {}
+        self._decoded: dict[int, image_ops.RGBImage] = {}
 
         self.threshold_var = tk.StringVar(value="—")
         self.status_var = tk.StringVar(value="Load an image to begin.")
@@ -115,6 +117,8 @@ class ImageProcessingApp:
 
         self.original_image = image
         self.processed_image = None
+        self._threshold_cache.clear()
+        self._decoded.clear()
 
         self._show_image(image, self.original_preview)
         self._clear_processed()
@@ -129,13 +133,18 @@ class ImageProcessingApp:
             )
             return
 
-        try:
-            threshold, result = image_ops.threshold_photoimage(
-                self.original_image, method
-            )
-        except ValueError as exc:
-            messagebox.showerror("Thresholding error", str(exc))
-            return
+        key = (id(self.original_image), method.lower())
+        if key in self._threshold_cache:
+            threshold, result = self._threshold_cache[key]
+        else:
+            try:
+                threshold, result = image_ops.threshold_array(
+                    self._decoded_original(), method
+                )
+            except ValueError as exc:
+                messagebox.showerror("Thresholding error", str(exc))
+                return
+            self._threshold_cache[key] = (threshold, result)
 
         self.processed_image = result
         self._show_image(result, self.processed_preview)
@@ -148,12 +157,18 @@ class ImageProcessingApp:
             messagebox.showinfo("No image", "Load an image before sharpening.")
             return
 
-        result = image_ops.sharpen_photoimage(self.original_image)
+        result = image_ops.sharpen_array(self._decoded_original())
         self.processed_image = result
         self._show_image(result, self.processed_preview)
         self.threshold_var.set("—")
         self.status_var.set("Applied Laplacian sharpening.")
 
+    def _decoded_original(self) -> image_ops.RGBImage:
+        key = id(self.original_image)
+        if key not in self._decoded:
+            self._decoded[key] = image_ops.photoimage_to_rgb(self.original_image)
+        return self._decoded[key]
+
     def _show_image(self, image: tk.PhotoImage, display: tk.Label) -> None:
         display.configure(image=image)
         display.image = image
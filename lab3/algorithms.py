@@ -2,141 +2,135 @@ from __future__ import annotations
 
 from typing import Callable
 
-Point = tuple[int, int]
-LineAlgorithm = Callable[[int, int, int, int], list[Point]]
-CircleAlgorithm = Callable[[int, int, int], list[Point]]
+import numpy as np
 
+try:
+    from . import algorithms_numba
+except ImportError:
+    try:  # pragma: no cover - allows running as script
+        import algorithms_numba
+    except ImportError:  # pragma: no cover - numba is an optional accelerator
+        algorithms_numba = None
 
-def step_line_points(x1: int, y1: int, x2: int, y2: int) -> list[Point]:
+PointArray = np.ndarray  # int32, shape (N, 2): one (x, y) row per raster point
+LineAlgorithm = Callable[[int, int, int, int], PointArray]
+CircleAlgorithm = Callable[[int, int, int], PointArray]
+
+
+def step_line_points(x1: int, y1: int, x2: int, y2: int) -> PointArray:
     dx = x2 - x1
     dy = y2 - y1
     if dx == 0 and dy == 0:
-        return [(x1, y1)]
+        return np.array([(x1, y1)], dtype=np.int32)
 
-    points: list[Point] = []
     if abs(dx) >= abs(dy):
-        slope = dy / dx if dx != 0 else 0.0
-        step = 1 if dx >= 0 else -1
-        x = x1
-        while True:
-            raw_y = y1 + slope * (x - x1)
-            point = (x, int(round(raw_y)))
-            if not points or point != points[-1]:
-                points.append(point)
-            if x == x2:
-                break
-            x += step
+        steps = np.arange(abs(dx) + 1)
+        xs = x1 + (1 if dx >= 0 else -1) * steps
+        ys = _rounded_minor_axis(y1, dy, abs(dx), steps)
     else:
-        inv_slope = dx / dy if dy != 0 else 0.0
-        step = 1 if dy >= 0 else -1
-        y = y1
-        while True:
-            raw_x = x1 + inv_slope * (y - y1)
-            point = (int(round(raw_x)), y)
-            if not points or point != points[-1]:
-                points.append(point)
-            if y == y2:
-                break
-            y += step
+        steps = np.arange(abs(dy) + 1)
+        ys = y1 + (1 if dy >= 0 else -1) * steps
+        xs = _rounded_minor_axis(x1, dx, abs(dy), steps)
+    return _stack_points(xs, ys)
+
+
+def _stack_points(xs: np.ndarray, ys: np.ndarray) -> PointArray:
+    points = np.empty((xs.size, 2), dtype=np.int32)
+    points[:, 0] = xs
+    points[:, 1] = ys
     return points
 
 
-def dda_line_points(x1: int, y1: int, x2: int, y2: int) -> list[Point]:
+def _rounded_minor_axis(
+    start: int, delta: int, run: int, steps: np.ndarray
+) -> np.ndarray:
+    # round(start + delta * step / run) in integers; ties go to the even
+    # coordinate, as round() does.
+    minor_step = 1 if delta >= 0 else -1
+    numerator = 2 * abs(delta) * steps
+    coords = start + minor_step * ((numerator + run) // (2 * run))
+    ties = numerator % (2 * run) == run
+    coords[ties & (coords % 2 != 0)] -= minor_step
+    return coords
+
+
+def dda_line_points(x1: int, y1: int, x2: int, y2: int) -> PointArray:
     dx = x2 - x1
     dy = y2 - y1
     steps = max(abs(dx), abs(dy))
     if steps == 0:
-        return [(x1, y1)]
-
-    points: list[Point] = []
-    x = float(x1)
-    y = float(y1)
-    x_inc = dx / steps
-    y_inc = dy / steps
+        return np.array([(x1, y1)], dtype=np.int32)
 
-    for _ in range(steps + 1):
-        point = (int(round(x)), int(round(y)))
-        if not points or point != points[-1]:
-            points.append(point)
-        x += x_inc
-        y += y_inc
+    # cumsum adds the increments sequentially, so the coordinates carry the
+    # same accumulated rounding as the incremental x += x_inc form.
+    x_path = np.full(steps + 1, dx / steps)
+    y_path = np.full(steps + 1, dy / steps)
+    x_path[0] = x1
+    y_path[0] = y1
+    xs = np.rint(np.cumsum(x_path)).astype(np.int64)
+    ys = np.rint(np.cumsum(y_path)).astype(np.int64)
+    return _stack_points(xs, ys)
 
-    return points
 
-
-def bresenham_line_points(x1: int, y1: int, x2: int, y2: int) -> list[Point]:
+def bresenham_line_points(x1: int, y1: int, x2: int, y2: int) -> PointArray:
     dx = abs(x2 - x1)
     dy = abs(y2 - y1)
     sx = 1 if x2 >= x1 else -1
     sy = 1 if y2 >= y1 else -1
+    if dx == 0 and dy == 0:
+        return np.array([(x1, y1)], dtype=np.int32)
 
-    x = x1
-    y = y1
-    points: list[Point] = [(x, y)]
-
+    # Closed form of the decision variable: after i major-axis steps the
+    # minor axis has advanced (2 * minor * i + major) // (2 * major) times.
     if dx >= dy:
-        err = 2 * dy - dx
-        for _ in range(dx):
-            if err >= 0:
-                y += sy
-                err -= 2 * dx
-            x += sx
-            err += 2 * dy
-            point = (x, y)
-            if point != points[-1]:
-                points.append(point)
+        steps = np.arange(dx + 1)
+        xs = x1 + sx * steps
+        ys = y1 + sy * ((2 * dy * steps + dx) // (2 * dx))
     else:
-        err = 2 * dx - dy
-        for _ in range(dy):
-            if err >= 0:
-                x += sx
-                err -= 2 * dy
-            y += sy
-            err += 2 * dx
-            point = (x, y)
-            if point != points[-1]:
-                points.append(point)
-
-    return points
+        steps = np.arange(dy + 1)
+        ys = y1 + sy * steps
+        xs = x1 + sx * ((2 * dx * steps + dy) // (2 * dy))
+    return _stack_points(xs, ys)
 
 
-def bresenham_circle_points(xc: int, yc: int, radius: int) -> list[Point]:
+def bresenham_circle_points(xc: int, yc: int, radius: int) -> PointArray:
     if radius < 0:
         raise ValueError("Radius must be non-negative.")
 
-    points: list[Point] = []
-    seen: set[Point] = set()
+    if radius == 0:
+        return np.array([(xc, yc)], dtype=np.int32)
+
+    # The x == 0 step lies on the axes, where mirrors coincide pairwise.
+    coords = [xc, yc + radius, xc, yc - radius, xc + radius, yc, xc - radius, yc]
+    extend = coords.extend
     x = 0
     y = radius
     d = 3 - 2 * radius
 
-    while y >= x:
-        for px, py in _circle_symmetry_points(xc, yc, x, y):
-            point = (px, py)
-            if point not in seen:
-                seen.add(point)
-                points.append(point)
+    while True:
         x += 1
         if d > 0:
             y -= 1
             d += 4 * (x - y) + 10
         else:
             d += 4 * x + 6
-
-    return points
-
-
-def _circle_symmetry_points(xc: int, yc: int, x: int, y: int) -> list[Point]:
-    return [
-        (xc + x, yc + y),
-        (xc - x, yc + y),
-        (xc + x, yc - y),
-        (xc - x, yc - y),
-        (xc + y, yc + x),
-        (xc - y, yc + x),
-        (xc + y, yc - x),
-        (xc - y, yc - x),
-    ]
+        if x >= y:
+            # Last step: on the diagonal only four mirrors are distinct.
+            if x == y:
+                extend((xc + x, yc + y, xc - x, yc + y, xc + x, yc - y, xc - x, yc - y))
+            break
+        extend((
+            xc + x, yc + y,
+            xc - x, yc + y,
+            xc + x, yc - y,
+            xc - x, yc - y,
+            xc + y, yc + x,
+            xc - y, yc + x,
+            xc + y, yc - x,
+            xc - y, yc - x,
+        ))  # fmt: skip
+
+    return np.array(coords, dtype=np.int32).reshape(-1, 2)
 
 
 LINE_ALGORITHMS: dict[str, dict[str, object]] = {
@@ -164,3 +158,35 @@ CIRCLE_ALGORITHMS: dict[str, dict[str, object]] = {
         "func": bresenham_circle_points,
     }
 }
+
+if algorithms_numba is not None:
+    LINE_ALGORITHMS["step_line"]["func"] = algorithms_numba.step_line_points
+    LINE_ALGORITHMS["dda_line"]["func"] = algorithms_numba.dda_line_points
+    LINE_ALGORITHMS["bresenham_line"]["func"] = algorithms_numba.bresenham_line_points
+    CIRCLE_ALGORITHMS["bresenham_circle"][
+        "func"
+    ] = algorithms_numba.bresenham_circle_points
+
+# Parallel per-field views of the registries above, for hot loops that
+# would otherwise repeat the same dict lookups on every redraw.
+LINE_KEYS: tuple[str, ...] = tuple(LINE_ALGORITHMS)
+LINE_FUNCS: tuple[LineAlgorithm, ...] = tuple(  # type: ignore[assignment]
+    meta["func"] for meta in LINE_ALGORITHMS.values()
+)
+LINE_LABELS: tuple[str, ...] = tuple(  # type: ignore[assignment]
+    meta["label"] for meta in LINE_ALGORITHMS.values()
+)
+LINE_COLORS: tuple[str, ...] = tuple(  # type: ignore[assignment]
+    meta["color"] for meta in LINE_ALGORITHMS.values()
+)
+
+CIRCLE_KEYS: tuple[str, ...] = tuple(CIRCLE_ALGORITHMS)
+CIRCLE_FUNCS: tuple[CircleAlgorithm, ...] = tuple(  # type: ignore[assignment]
+    meta["func"] for meta in CIRCLE_ALGORITHMS.values()
+)
+CIRCLE_LABELS: tuple[str, ...] = tuple(  # type: ignore[assignment]
+    meta["label"] for meta in CIRCLE_ALGORITHMS.values()
+)
+CIRCLE_COLORS: tuple[str, ...] = tuple(  # type: ignore[assignment]
+    meta["color"] for meta in CIRCLE_ALGORITHMS.values()
+)
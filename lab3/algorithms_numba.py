@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# Explicit signatures compile every kernel when the module is imported, so
+# the first draw does not stall the UI on lazy JIT compilation.
+LINE_SIGNATURE = "int32[:, ::1](int64, int64, int64, int64)"
+CIRCLE_SIGNATURE = "int32[:, ::1](int64, int64, int64)"
+
+
+@njit("int64(int64, int64, int64, int64, int64)")
+def _rounded_minor_axis(start: int, sign: int, delta: int, run: int, step: int) -> int:
+    if run == 0:
+        return start
+    numerator = 2 * delta * step
+    coord = start + sign * ((numerator + run) // (2 * run))
+    if numerator % (2 * run) == run and coord % 2 != 0:
+        coord -= sign
+    return coord
+
+
+@njit(LINE_SIGNATURE)
+def step_line_points(x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+    dx = x2 - x1
+    dy = y2 - y1
+    sx = 1 if dx >= 0 else -1
+    sy = 1 if dy >= 0 else -1
+    dx = abs(dx)
+    dy = abs(dy)
+
+    points = np.empty((max(dx, dy) + 1, 2), dtype=np.int32)
+    if dx >= dy:
+        for i in range(dx + 1):
+            points[i, 0] = x1 + sx * i
+            points[i, 1] = _rounded_minor_axis(y1, sy, dy, dx, i)
+    else:
+        for i in range(dy + 1):
+            points[i, 0] = _rounded_minor_axis(x1, sx, dx, dy, i)
+            points[i, 1] = y1 + sy * i
+    return points
+
+
+@njit(LINE_SIGNATURE)
+def dda_line_points(x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = max(abs(dx), abs(dy))
+    points = np.empty((steps + 1, 2), dtype=np.int32)
+    points[0, 0] = x1
+    points[0, 1] = y1
+    if steps == 0:
+        return points
+
+    x = float(x1)
+    y = float(y1)
+    x_inc = dx / steps
+    y_inc = dy / steps
+    for i in range(1, steps + 1):
+        x += x_inc
+        y += y_inc
+        points[i, 0] = np.rint(x)
+        points[i, 1] = np.rint(y)
+    return points
+
+
+@njit(LINE_SIGNATURE)
+def bresenham_line_points(x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x2 >= x1 else -1
+    sy = 1 if y2 >= y1 else -1
+
+    x = x1
+    y = y1
+    points = np.empty((max(dx, dy) + 1, 2), dtype=np.int32)
+    points[0, 0] = x
+    points[0, 1] = y
+
+    if dx >= dy:
+        err = 2 * dy - dx
+        for i in range(1, dx + 1):
+            if err >= 0:
+                y += sy
+                err -= 2 * dx
+            x += sx
+            err += 2 * dy
+            points[i, 0] = x
+            points[i, 1] = y
+    else:
+        err = 2 * dx - dy
+        for i in range(1, dy + 1):
+            if err >= 0:
+                x += sx
+                err -= 2 * dy
+            y += sy
+            err += 2 * dx
+            points[i, 0] = x
+            points[i, 1] = y
+
+    return points
+
+
+@njit(CIRCLE_SIGNATURE)
+def bresenham_circle_points(xc: int, yc: int, radius: int) -> np.ndarray:
+    if radius < 0:
+        raise ValueError("Radius must be non-negative.")
+
+    points = np.empty((8 * (radius + 1), 2), dtype=np.int32)
+    count = 0
+    x = 0
+    y = radius
+    d = 3 - 2 * radius
+
+    while y >= x:
+        # Mirrored points coincide only on the axes (x == 0) and on the
+        # diagonals (x == y), so those cases emit fewer points.
+        if x == 0:
+            if y == 0:
+                points[count, 0] = xc
+                points[count, 1] = yc
+                count += 1
+            else:
+                for px, py in ((xc, yc + y), (xc, yc - y), (xc + y, yc), (xc - y, yc)):
+                    points[count, 0] = px
+                    points[count, 1] = py
+                    count += 1
+        else:
+            for px, py in (
+                (xc + x, yc + y),
+                (xc - x, yc + y),
+                (xc + x, yc - y),
+                (xc - x, yc - y),
+            ):
+                points[count, 0] = px
+                points[count, 1] = py
+                count += 1
+            if x != y:
+                for px, py in (
+                    (xc + y, yc + x),
+                    (xc - y, yc + x),
+                    (xc + y, yc - x),
+                    (xc - y, yc - x),
+                ):
+                    points[count, 0] = px
+                    points[count, 1] = py
+                    count += 1
+        x += 1
+        if d > 0:
+            y -= 1
+            d += 4 * (x - y) + 10
+        else:
+            d += 4 * x + 6
+
+    return points[:count]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-import random
 import time
+from collections import deque
+from itertools import starmap
+
+import numpy as np
 
 try:
     from .algorithms import (
@@ -19,6 +22,33 @@ except ImportError:  # pragma: no cover - allows running as script
     )
 
 
+LineDataset = list[list[int]]  # [x1, y1, x2, y2] per test
+CircleDataset = list[list[int]]  # [xc, yc, radius] per test
+
+_DATASET_CACHE: dict[tuple[int, int, int], tuple[LineDataset, CircleDataset]] = {}
+
+
+def _build_datasets(
+    seed: int, line_tests: int, circle_tests: int
+) -> tuple[LineDataset, CircleDataset]:
+    key = (seed, line_tests, circle_tests)
+    cached = _DATASET_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    rng = np.random.default_rng(seed)
+    line_dataset = rng.integers(-60, 61, size=(line_tests, 4)).tolist()
+    circle_dataset = np.column_stack(
+        (
+            rng.integers(-30, 31, size=circle_tests),
+            rng.integers(-30, 31, size=circle_tests),
+            rng.integers(1, 31, size=circle_tests),
+        )
+    ).tolist()
+    _DATASET_CACHE[key] = (line_dataset, circle_dataset)
+    return line_dataset, circle_dataset
+
+
 def run_benchmarks(
     line_algorithms: dict[str, dict[str, object]],
     circle_algorithms: dict[str, dict[str, object]],
@@ -26,31 +56,14 @@ def run_benchmarks(
     line_tests: int = 4000,
     circle_tests: int = 2500,
 ) -> list[dict[str, float | str | int]]:
-    rng = random.Random(seed)
-    line_dataset = [
-        (
-            rng.randint(-60, 60),
-            rng.randint(-60, 60),
-            rng.randint(-60, 60),
-            rng.randint(-60, 60),
-        )
-        for _ in range(line_tests)
-    ]
-    circle_dataset = [
-        (
-            rng.randint(-30, 30),
-            rng.randint(-30, 30),
-            rng.randint(1, 30),
-        )
-        for _ in range(circle_tests)
-    ]
+    line_dataset, circle_dataset = _build_datasets(seed, line_tests, circle_tests)
 
     results: list[dict[str, float | str | int]] = []
     for key, meta in line_algorithms.items():
         func: LineAlgorithm = meta["func"]  # type: ignore[assignment]
+        func(*line_dataset[0])  # warm-up, triggers JIT compilation if any
         start = time.perf_counter()
-        for args in line_dataset:
-            func(*args)
+        deque(starmap(func, line_dataset), maxlen=0)
         elapsed_ms = (time.perf_counter() - start) * 1000
         avg_us = (elapsed_ms / line_tests) * 1000
         results.append(
@@ -64,9 +77,9 @@ def run_benchmarks(
 
     for key, meta in circle_algorithms.items():
         func: CircleAlgorithm = meta["func"]  # type: ignore[assignment]
+        func(*circle_dataset[0])  # warm-up, triggers JIT compilation if any
         start = time.perf_counter()
-        for args in circle_dataset:
-            func(*args)
+        deque(starmap(func, circle_dataset), maxlen=0)
         elapsed_ms = (time.perf_counter() - start) * 1000
         avg_us = (elapsed_ms / circle_tests) * 1000
         results.append(
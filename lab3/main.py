@@ -3,23 +3,39 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+import numpy as np
+
 try:
     from .algorithms import (
-        CIRCLE_ALGORITHMS,
-        LINE_ALGORITHMS,
-        CircleAlgorithm,
-        LineAlgorithm,
-        Point,
+        CIRCLE_COLORS,
+        CIRCLE_FUNCS,
+        CIRCLE_KEYS,
+        CIRCLE_LABELS,
+        LINE_COLORS,
+        LINE_FUNCS,
+        LINE_KEYS,
+        LINE_LABELS,
+        PointArray,
     )
 except ImportError:  # pragma: no cover - allows running as script
     from algorithms import (
-        CIRCLE_ALGORITHMS,
-        LINE_ALGORITHMS,
-        CircleAlgorithm,
-        LineAlgorithm,
-        Point,
+        CIRCLE_COLORS,
+        CIRCLE_FUNCS,
+        CIRCLE_KEYS,
+        CIRCLE_LABELS,
+        LINE_COLORS,
+        LINE_FUNCS,
+        LINE_KEYS,
+        LINE_LABELS,
+        PointArray,
     )
 
+# Resize drags and slider moves fire in bursts; render once they settle.
+RENDER_DEBOUNCE_MS = 30
+
+# Each cached grid is a canvas-sized frame; keep only the latest few sizes.
+GRID_FRAME_CACHE_SIZE = 8
+
 
 class RasterApp:
     def __init__(self, root: tk.Tk) -> None:
@@ -44,15 +60,18 @@ class RasterApp:
         }
 
         self.algorithm_flags: dict[str, tk.BooleanVar] = {}
-        for key in LINE_ALGORITHMS:
-            self.algorithm_flags[key] = tk.BooleanVar(value=True)
-        for key in CIRCLE_ALGORITHMS:
+        for key in LINE_KEYS + CIRCLE_KEYS:
             self.algorithm_flags[key] = tk.BooleanVar(value=True)
 
         self.current_line: tuple[int, int, int, int] | None = None
         self.current_circle: tuple[int, int, int] | None = None
 
         self.canvas: tk.Canvas
+        self._raster_image: tk.PhotoImage | None = None
+        self._grid_frame_cache: dict[tuple[int, int, int], np.ndarray] = {}
+        self._line_cache: dict[tuple[str, tuple[int, int, int, int]], PointArray] = {}
+        self._circle_cache: dict[tuple[str, tuple[int, int, int]], PointArray] = {}
+        self._render_after_id: str | None = None
 
         self._build_ui()
         self.render_scene()
@@ -96,7 +115,7 @@ class RasterApp:
             highlightthickness=0,
         )
         self.canvas.grid(row=0, column=0, sticky="nsew")
-        self.canvas.bind("<Configure>", lambda _event: self.render_scene())
+        self.canvas.bind("<Configure>", lambda _event: self._schedule_render())
 
     def _build_line_inputs(self, parent: ttk.Frame) -> None:
         frame = ttk.LabelFrame(parent, text="Line parameters", padding=12)
@@ -141,25 +160,16 @@ class RasterApp:
         )
 
         row_index = 1
-        for key in LINE_ALGORITHMS:
-            meta = LINE_ALGORITHMS[key]
-            color_box = tk.Label(frame, background=meta["color"], width=2)
+        for key, label, color in zip(
+            LINE_KEYS + CIRCLE_KEYS,
+            LINE_LABELS + CIRCLE_LABELS,
+            LINE_COLORS + CIRCLE_COLORS,
+        ):
+            color_box = tk.Label(frame, background=color, width=2)
             color_box.grid(row=row_index, column=0, sticky="w", padx=(0, 6))
             ttk.Checkbutton(
                 frame,
-                text=meta["label"],
-                variable=self.algorithm_flags[key],
-                command=self.render_scene,
-            ).grid(row=row_index, column=1, sticky="w")
-            row_index += 1
-
-        for key in CIRCLE_ALGORITHMS:
-            meta = CIRCLE_ALGORITHMS[key]
-            color_box = tk.Label(frame, background=meta["color"], width=2)
-            color_box.grid(row=row_index, column=0, sticky="w", padx=(0, 6))
-            ttk.Checkbutton(
-                frame,
-                text=meta["label"],
+                text=label,
                 variable=self.algorithm_flags[key],
                 command=self.render_scene,
             ).grid(row=row_index, column=1, sticky="w")
@@ -176,7 +186,7 @@ class RasterApp:
             orient="horizontal",
             resolution=1,
             variable=self.scale_var,
-            command=lambda _value: self.render_scene(),
+            command=lambda _value: self._schedule_render(),
         )
         scale_slider.grid(row=row_index, column=0, columnspan=2, sticky="ew")
         row_index += 1
@@ -205,6 +215,7 @@ class RasterApp:
             return
 
         self.current_line = (x1, y1, x2, y2)
+        self._line_cache.clear()
         self.status_var.set(f"Line set from ({x1}, {y1}) to ({x2}, {y2}).")
         self.render_scene()
 
@@ -224,15 +235,27 @@ class RasterApp:
             return
 
         self.current_circle = (xc, yc, radius)
+        self._circle_cache.clear()
         self.status_var.set(f"Circle set at ({xc}, {yc}) with radius {radius}.")
         self.render_scene()
 
     def clear_scene(self) -> None:
         self.current_line = None
         self.current_circle = None
+        self._line_cache.clear()
+        self._circle_cache.clear()
         self.status_var.set("Drawing cleared.")
         self.render_scene()
 
+    def _schedule_render(self) -> None:
+        if self._render_after_id is not None:
+            self.root.after_cancel(self._render_after_id)
+        self._render_after_id = self.root.after(RENDER_DEBOUNCE_MS, self._do_render)
+
+    def _do_render(self) -> None:
+        self._render_after_id = None
+        self.render_scene()
+
     def render_scene(self) -> None:
         self.canvas.delete("all")
         self.canvas.update_idletasks()
@@ -241,27 +264,66 @@ class RasterApp:
         height = max(int(self.canvas.winfo_height()), 200)
         origin_x = round(width / 2) + 0.5
         origin_y = round(height / 2) + 0.5
+        base_x = int(origin_x)
+        base_y = int(origin_y)
 
         scale = max(self.scale_var.get(), 1)
 
-        self._draw_grid(width, height, origin_x, origin_y, scale)
-        self._draw_axes(width, height, origin_x, origin_y)
+        # Algorithms paint palette indices into a map with one entry per
+        # raster cell; the map is then expanded over the framebuffer.
+        column_cells = (np.arange(width) - base_x) // scale
+        row_cells = (base_y - 1 - np.arange(height)) // scale
+        cells = np.zeros(
+            (
+                row_cells[0] - row_cells[-1] + 1,
+                column_cells[-1] - column_cells[0] + 1,
+            ),
+            dtype=np.uint8,
+        )
+        palette: list[tuple[int, ...]] = [(0, 0, 0)]
 
         if self.current_line:
-            for key, meta in LINE_ALGORITHMS.items():
+            for key, func, color in zip(LINE_KEYS, LINE_FUNCS, LINE_COLORS):
                 if not self.algorithm_flags[key].get():
                     continue
-                func: LineAlgorithm = meta["func"]  # type: ignore[assignment]
-                points = func(*self.current_line)
-                self._draw_points(points, origin_x, origin_y, scale, meta["color"])
+                cache_key = (key, self.current_line)
+                points = self._line_cache.get(cache_key)
+                if points is None:
+                    points = func(*self.current_line)
+                    self._line_cache[cache_key] = points
+                palette.append(_hex_to_rgb(color))
+                _paint_cells(
+                    cells, points, column_cells[0], row_cells[0], len(palette) - 1
+                )
 
         if self.current_circle:
-            for key, meta in CIRCLE_ALGORITHMS.items():
+            for key, func, color in zip(CIRCLE_KEYS, CIRCLE_FUNCS, CIRCLE_COLORS):
                 if not self.algorithm_flags[key].get():
                     continue
-                func: CircleAlgorithm = meta["func"]  # type: ignore[assignment]
-                points = func(*self.current_circle)
-                self._draw_points(points, origin_x, origin_y, scale, meta["color"])
+                cache_key = (key, self.current_circle)
+                points = self._circle_cache.get(cache_key)
+                if points is None:
+                    points = func(*self.current_circle)
+                    self._circle_cache[cache_key] = points
+                palette.append(_hex_to_rgb(color))
+                _paint_cells(
+                    cells, points, column_cells[0], row_cells[0], len(palette) - 1
+                )
+
+        frame = self._grid_frame(width, height, base_x, base_y, scale)
+        if len(palette) > 1:
+            layer = cells[
+                row_cells[0] - row_cells[:, None], column_cells - column_cells[0]
+            ]
+            painted = layer != 0
+            frame = frame.copy()
+            frame[painted] = np.array(palette, dtype=np.uint8)[layer[painted]]
+
+        self._raster_image = _frame_to_photoimage(frame)
+        self.canvas.create_image(0, 0, image=self._raster_image, anchor="nw")
+
+        self._draw_grid_labels(width, height, origin_x, origin_y, scale)
+        self._draw_axis_labels(width, origin_x, origin_y)
 
         self.canvas.create_text(
             8,
@@ -272,54 +334,65 @@ class RasterApp:
             font=("Helvetica", 10),
         )
 
-    def _draw_grid(
+    def _grid_frame(
+        self, width: int, height: int, base_x: int, base_y: int, scale: int
+    ) -> np.ndarray:
+        key = (width, height, scale)
+        frame = self._grid_frame_cache.get(key)
+        if frame is None:
+            frame = self._build_grid_frame(width, height, base_x, base_y, scale)
+            if len(self._grid_frame_cache) >= GRID_FRAME_CACHE_SIZE:
+                self._grid_frame_cache.pop(next(iter(self._grid_frame_cache)))
+            self._grid_frame_cache[key] = frame
+        return frame
+
+    def _build_grid_frame(
+        self, width: int, height: int, base_x: int, base_y: int, scale: int
+    ) -> np.ndarray:
+        frame = np.full((height, width, 3), 255, dtype=np.uint8)
+
+        grid_color = _hex_to_rgb("#e5e7eb")
+        frame[:, base_x % scale :: scale] = grid_color
+        frame[base_y % scale :: scale] = grid_color
+
+        axis_color = _hex_to_rgb("#6b7280")
+        frame[max(base_y - 1, 0) : base_y + 1] = axis_color
+        frame[:, max(base_x - 1, 0) : base_x + 1] = axis_color
+
+        frame.flags.writeable = False
+        return frame
+
+    def _draw_grid_labels(
         self, width: int, height: int, origin_x: float, origin_y: float, scale: int
     ) -> None:
         max_x = int(width / (2 * scale)) + 2
         max_y = int(height / (2 * scale)) + 2
-        grid_color = "#e5e7eb"
-
-        for step in range(-max_x, max_x + 1):
-            x = origin_x + step * scale
-            self.canvas.create_line(x, 0, x, height, fill=grid_color)
 
-        for step in range(-max_y, max_y + 1):
-            y = origin_y + step * scale
-            self.canvas.create_line(0, y, width, y, fill=grid_color)
-
-        label_color = "#9ca3af"
+        # One Tcl script for all labels instead of a create_text round trip
+        # per tick.
+        label_options = "-fill #9ca3af -font {Helvetica 9}"
+        commands: list[str] = []
         for step in range(-max_x, max_x + 1):
             if step == 0:
                 continue
             x = origin_x + step * scale
-            self.canvas.create_text(
-                x,
-                origin_y + 4,
-                text=str(step),
-                fill=label_color,
-                font=("Helvetica", 9),
-                anchor="n",
+            commands.append(
+                f"{self.canvas} create text {x} {origin_y + 4} -text {step} "
+                f"{label_options} -anchor n"
             )
 
         for step in range(-max_y, max_y + 1):
             if step == 0:
                 continue
             y = origin_y - step * scale
-            self.canvas.create_text(
-                origin_x + 4,
-                y,
-                text=str(step),
-                fill=label_color,
-                font=("Helvetica", 9),
-                anchor="w",
+            commands.append(
+                f"{self.canvas} create text {origin_x + 4} {y} -text {step} "
+                f"{label_options} -anchor w"
             )
+        self.canvas.tk.eval("\n".join(commands))
 
-    def _draw_axes(
-        self, width: int, height: int, origin_x: float, origin_y: float
-    ) -> None:
+    def _draw_axis_labels(self, width: int, origin_x: float, origin_y: float) -> None:
         axis_color = "#6b7280"
-        self.canvas.create_line(0, origin_y, width, origin_y, fill=axis_color, width=2)
-        self.canvas.create_line(origin_x, 0, origin_x, height, fill=axis_color, width=2)
         self.canvas.create_text(
             width - 8, origin_y - 12, text="x", fill=axis_color, font=("Helvetica", 11)
         )
@@ -327,27 +400,29 @@ class RasterApp:
             origin_x + 12, 12, text="y", fill=axis_color, font=("Helvetica", 11)
         )
 
-    def _draw_points(
-        self,
-        points: list[Point],
-        origin_x: float,
-        origin_y: float,
-        scale: int,
-        color: str,
-    ) -> None:
-        for x, y in points:
-            left = origin_x + x * scale
-            right = origin_x + (x + 1) * scale
-            top = origin_y - y * scale
-            bottom = origin_y - (y + 1) * scale
-            self.canvas.create_rectangle(
-                left,
-                top,
-                right,
-                bottom,
-                fill=color,
-                outline="",
-            )
+
+def _paint_cells(
+    cells: np.ndarray, points: PointArray, min_x: int, max_y: int, index: int
+) -> None:
+    columns = points[:, 0] - min_x
+    rows = max_y - points[:, 1]
+    visible = (
+        (columns >= 0)
+        & (columns < cells.shape[1])
+        & (rows >= 0)
+        & (rows < cells.shape[0])
+    )
+    cells[rows[visible], columns[visible]] = index
+
+
+def _hex_to_rgb(color: str) -> tuple[int, ...]:
+    return tuple(bytes.fromhex(color[1:]))
+
+
+def _frame_to_photoimage(frame: np.ndarray) -> tk.PhotoImage:
+    height, width = frame.shape[:2]
+    header = b"P6\n%d %d\n255\n" % (width, height)
+    return tk.PhotoImage(data=header + frame.tobytes(), format="ppm")
 
 
 def main() -> None: